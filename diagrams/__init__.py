@@ -0,0 +1,5 @@
+"""
+Graphviz diagram generators for the AutoIR README.
+
+Run a single diagram with e.g. `python -m diagrams.overview` from the repo root.
+"""
@@ -0,0 +1,32 @@
+"""
+Regenerate every diagram in parallel, one worker process per diagram.
+
+Outputs: diagrams/out/*.svg
+Run:     python -m diagrams
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from ._cache import build, report, up_to_date
+from ._common import ensure_out_dir
+
+NAMES = ["deployment", "llm_flow", "overview", "pipeline", "search_ui"]
+
+
+def main() -> None:
+    out = ensure_out_dir()
+
+    rendered = {}
+    stale = [name for name in NAMES if not up_to_date(name, out)]
+    if stale:
+        with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as ex:
+            rendered = dict(zip(stale, ex.map(build, stale, repeat(out))))
+
+    for name in NAMES:
+        report(name, out, rendered.get(name, False))
+
+
+if __name__ == "__main__":
+    main()
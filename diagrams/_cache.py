@@ -0,0 +1,100 @@
+"""
+Content-addressed render cache shared by the diagram generators.
+
+Invalidation is two-level. Each output SVG gets a sidecar `<name>.sha256`
+holding the hash of what it was produced from (DOT source and style map) and
+the SVG optimizer that ran on it; unchanged inputs skip all work, including
+svgo. In front of that, up_to_date() is the cheap Make-style gate: an SVG
+with a sidecar for the current optimizer that is at least as new as
+its generator module and the shared helpers is not even hashed. A hash hit
+touches the SVG so that the next run stops at the gate again. The sidecars are
+committed next to the SVGs, so a fresh checkout, whose mtimes say nothing,
+stops at the hash check and needs no Graphviz.
+
+The raw `dot` layout for each diagram is cached separately in
+`diagrams/.cache/`, keyed on the DOT source alone, so post-processing such as
+restyle_svg() can change without paying for a new layout.
+"""
+
+import hashlib
+import importlib
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+from ._common import CACHE_DIR, SVG_OPTIMIZER, optimize_svg, render_dot
+from ._restyle import restyle_svg
+
+PACKAGE_DIR = Path(__file__).parent
+
+# Every diagram is also a function of these, besides its own module
+SHARED_SOURCES = tuple(PACKAGE_DIR / f for f in ("_cache.py", "_common.py", "_restyle.py"))
+
+OPTIMIZE_TAG = f"optimizer={SVG_OPTIMIZER}"
+
+
+def up_to_date(name: str, out_dir: Path) -> bool:
+    out_file = out_dir / f"{name}.svg"
+    hash_path = out_dir / f"{name}.sha256"
+    if not (out_file.exists() and hash_path.exists()):
+        return False
+    if not hash_path.read_text().strip().endswith(OPTIMIZE_TAG):
+        return False
+    sources = (PACKAGE_DIR / f"{name}.py",) + SHARED_SOURCES
+    return out_file.stat().st_mtime >= max(p.stat().st_mtime for p in sources)
+
+
+def content_hash(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def output_stamp(source: str, style: Optional[Dict[str, Dict[str, str]]] = None) -> str:
+    return f"{content_hash(source, repr(style))} {OPTIMIZE_TAG}"
+
+
+def is_fresh(stamp: str, out_dir: Path, name: str) -> bool:
+    svg_path = out_dir / f"{name}.svg"
+    hash_path = out_dir / f"{name}.sha256"
+    return svg_path.exists() and hash_path.exists() and hash_path.read_text().strip() == stamp
+
+
+def write_hash(stamp: str, out_dir: Path, name: str) -> None:
+    (out_dir / f"{name}.sha256").write_text(stamp + "\n")
+
+
+def render_layout(source: str, name: str) -> Path:
+    digest = content_hash(source)
+    if not is_fresh(digest, CACHE_DIR, name):
+        render_dot(source, CACHE_DIR, name)
+        write_hash(digest, CACHE_DIR, name)
+    return CACHE_DIR / f"{name}.svg"
+
+
+def render_cached(source: str, out_dir: Path, name: str, style: Optional[Dict[str, Dict[str, str]]] = None) -> bool:
+    out_file = out_dir / f"{name}.svg"
+    if is_fresh(output_stamp(source, style), out_dir, name):
+        os.utime(out_file)
+        return False
+
+    layout = render_layout(source, name)
+    if style:
+        restyle_svg(layout, style, out_file)
+    else:
+        shutil.copyfile(layout, out_file)
+    # Only the output is optimized; the cached layout stays raw for restyle_svg
+    tool = optimize_svg(out_file)
+    write_hash(f"{content_hash(source, repr(style))} optimizer={tool}", out_dir, name)
+    return True
+
+
+def build(name: str, out_dir: Path) -> bool:
+    """Regenerate diagram `name` unless it is cached; return whether its SVG was rewritten."""
+    if up_to_date(name, out_dir):
+        return False
+    return importlib.import_module(f"{__package__}.{name}").generate(out_dir)
+
+
+def report(name: str, out_dir: Path, rendered: bool) -> None:
+    out_file = out_dir / f"{name}.svg"
+    print(f"Wrote {out_file}" if rendered else f"Up to date {out_file}")
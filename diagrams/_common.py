@@ -0,0 +1,71 @@
+"""
+Helpers shared by the diagram generators.
+
+Set DIAGRAMS_OPTIMIZE_SVG=1 to post-process each written SVG with `svgo`, or
+`scour` if svgo is not installed. svgo runs with `svgo.config.mjs`, which keeps
+the `<title>` elements its default preset would strip; scour keeps them
+unless told otherwise.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+OUT_DIR = Path(__file__).parent / "out"
+OUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Intermediate renders (raw dot layouts) stay out of the committed out/ dir
+CACHE_DIR = Path(__file__).parent / ".cache"
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Resolved once so each render skips the PATH lookup
+DOT_BIN = shutil.which("dot") or "dot"
+SVGO_BIN = shutil.which("svgo")
+SCOUR_BIN = shutil.which("scour")
+
+SVGO_CONFIG = Path(__file__).parent / "svgo.config.mjs"
+
+OPTIMIZE_SVG = os.environ.get("DIAGRAMS_OPTIMIZE_SVG") == "1"
+
+# The tool optimize_svg() will actually run: "svgo", "scour" or "none"
+if not OPTIMIZE_SVG:
+    SVG_OPTIMIZER = "none"
+elif SVGO_BIN:
+    SVG_OPTIMIZER = "svgo"
+elif SCOUR_BIN:
+    SVG_OPTIMIZER = "scour"
+else:
+    SVG_OPTIMIZER = "none"
+
+
+def ensure_out_dir() -> Path:
+    return OUT_DIR
+
+
+def render_dot(source: str, out_dir: Path, name: str) -> Path:
+    # Pipe the source through dot so only the final SVG touches the disk
+    proc = subprocess.run([DOT_BIN, "-Tsvg"], input=source.encode(), stdout=subprocess.PIPE, check=True)
+    svg_path = out_dir / f"{name}.svg"
+    svg_path.write_bytes(proc.stdout)
+    return svg_path
+
+
+def optimize_svg(path: Path) -> str:
+    """Optimize `path` in place and return the name of the tool that ran."""
+    if SVG_OPTIMIZER == "none":
+        return SVG_OPTIMIZER
+
+    # Written outside out/ so a failed run leaves nothing next to the SVGs
+    tmp_path = CACHE_DIR / f"{path.stem}.opt.svg"
+    if SVG_OPTIMIZER == "svgo":
+        cmd = [SVGO_BIN, "--config", str(SVGO_CONFIG), "-i", str(path), "-o", str(tmp_path)]
+    else:
+        cmd = [SCOUR_BIN, "-i", str(path), "-o", str(tmp_path)]
+
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return SVG_OPTIMIZER
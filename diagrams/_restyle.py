@@ -0,0 +1,46 @@
+"""
+Recolor an already laid-out Graphviz SVG without re-running the layout engine.
+
+Graphviz wraps every cluster, node and edge in a `<g>` whose first child is a
+`<title>` holding its name (`cluster_aws`, `cw`, `cw->daemon`, ...). The style
+map is keyed on those titles and maps SVG attributes (`stroke`, `fill`) to the
+values to set on the shapes inside the group.
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Optional
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+SHAPE_TAGS = {f"{{{SVG_NS}}}{tag}" for tag in ("path", "polygon", "polyline", "ellipse")}
+
+
+def restyle_svg(svg_path: Path, style_map: Dict[str, Dict[str, str]], out_path: Optional[Path] = None) -> Path:
+    tree = ET.parse(svg_path)
+
+    groups = {}
+    for g in tree.iter(f"{{{SVG_NS}}}g"):
+        title = g.find(f"{{{SVG_NS}}}title")
+        if title is not None and title.text:
+            groups[title.text] = g
+
+    for title, attrs in style_map.items():
+        if title not in groups:
+            raise KeyError(f"No element titled {title!r} in {svg_path}")
+        for shape in groups[title]:
+            if shape.tag not in SHAPE_TAGS:
+                continue
+            for attr, value in attrs.items():
+                # Leave unfilled outlines (edge splines, cluster borders) unfilled
+                if attr == "fill" and shape.get("fill") == "none":
+                    continue
+                shape.set(attr, value)
+
+    out_path = out_path or svg_path
+    tree.write(out_path, encoding="UTF-8", xml_declaration=True)
+    return out_path
@@ -0,0 +1,70 @@
+"""
+Regenerate every diagram with a single `dot` process.
+
+All stale DOT sources are concatenated on stdin of one `dot -Tsvg` call, and
+the SVG documents it emits back-to-back on stdout are split into the layout
+cache before each generator's generate() finishes from it.
+
+dot keeps a graph's `layout` engine for every later graph in the same stream
+(even with -K), so diagrams that choose their own engine are left out of the
+batch and rendered individually by build().
+
+Outputs: diagrams/out/*.svg
+Run:     python -m diagrams.build_all
+"""
+
+import re
+import subprocess
+from typing import List
+
+from . import deployment, llm_flow, overview, pipeline, search_ui
+from ._cache import build, content_hash, is_fresh, output_stamp, report, up_to_date, write_hash
+from ._common import CACHE_DIR, DOT_BIN, ensure_out_dir
+
+MODULES = (deployment, llm_flow, overview, pipeline, search_ui)
+
+SVG_HEADER = b"<?xml"
+
+LAYOUT_ATTR = re.compile(r"\blayout\s*=")
+
+# dot prefixes the ids of every graph after the first in a stream with its page
+PAGE_ID_PREFIX = re.compile(rb'id="page\d+,\d+_')
+
+
+def render_batch(sources: List[str]) -> List[bytes]:
+    proc = subprocess.run(
+        [DOT_BIN, "-Tsvg"],
+        input="\n".join(sources).encode(),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    svgs = [PAGE_ID_PREFIX.sub(b'id="', SVG_HEADER + chunk) for chunk in proc.stdout.split(SVG_HEADER)[1:]]
+    if len(svgs) != len(sources):
+        raise RuntimeError(f"dot produced {len(svgs)} SVGs for {len(sources)} graphs")
+    return svgs
+
+
+def main() -> None:
+    out = ensure_out_dir()
+
+    stale = []
+    for module in MODULES:
+        if up_to_date(module.NAME, out) or LAYOUT_ATTR.search(module.DOT_SOURCE):
+            continue
+        if is_fresh(output_stamp(module.DOT_SOURCE, getattr(module, "STYLE", None)), out, module.NAME):
+            continue
+        if not is_fresh(content_hash(module.DOT_SOURCE), CACHE_DIR, module.NAME):
+            stale.append((module.NAME, module.DOT_SOURCE))
+
+    if stale:
+        for (name, source), svg in zip(stale, render_batch([source for _, source in stale])):
+            (CACHE_DIR / f"{name}.svg").write_bytes(svg)
+            write_hash(content_hash(source), CACHE_DIR, name)
+
+    # Every layout is now a cache hit; build() only runs post-processing
+    for module in MODULES:
+        report(module.NAME, out, build(module.NAME, out))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,47 @@
-#!/usr/bin/env python3
-
 """
 Generate a deployment diagram focusing on ECS Fargate stack (CFN, ECR, IAM).
 
 Outputs: diagrams/out/deployment.svg
+Run:     python -m diagrams.deployment
 """
 
 from pathlib import Path
-from graphviz import Digraph
+
+from ._cache import build, render_cached, report
+from ._common import ensure_out_dir
 
 
-def ensure_out_dir() -> Path:
-    out_dir = Path(__file__).parent / "out"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    return out_dir
+NAME = "deployment"
 
+DOT_SOURCE = r"""
+digraph autoir_deployment {
+    rankdir=TB
 
-def generate(path: Path) -> Path:
-    dot = Digraph("autoir_deployment", filename=str(path / "deployment"), format="svg")
-    dot.attr(rankdir="TB")
+    subgraph cluster_cfn {
+        label="CloudFormation Stack: AutoIR-Fargate" style=rounded
+        ecs [label="ECS Service: autoir" shape=box]
+        task [label="Task Definition" shape=box]
+        logs [label="CloudWatch Logs: /autoir/daemon" shape=component]
+        role [label="IAM Roles (task/execution)" shape=tab]
+    }
 
-    with dot.subgraph(name="cluster_cfn") as cfn:
-        cfn.attr(label="CloudFormation Stack: AutoIR-Fargate", style="rounded")
-        cfn.node("ecs", "ECS Service: autoir", shape="box")
-        cfn.node("task", "Task Definition", shape="box")
-        cfn.node("logs", "CloudWatch Logs: /autoir/daemon", shape="component")
-        cfn.node("role", "IAM Roles (task/execution)", shape="tab")
+    ecr [label="ECR: autoir:latest" shape=cylinder]
+    sg [label="VPC + Subnets + SG" shape=box]
 
-    dot.node("ecr", "ECR: autoir:latest", shape="cylinder")
-    dot.node("sg", "VPC + Subnets + SG", shape="box")
+    ecr -> task [label="Image"]
+    task -> ecs [label="Run"]
+    role -> task
+    ecs -> logs [label="awslogs"]
+    sg -> ecs
+}
+"""
 
-    dot.edge("ecr", "task", label="Image")
-    dot.edge("task", "ecs", label="Run")
-    dot.edge("role", "task")
-    dot.edge("ecs", "logs", label="awslogs")
-    dot.edge("sg", "ecs")
 
-    return Path(dot.render(cleanup=True))
+def generate(path: Path) -> bool:
+    return render_cached(DOT_SOURCE, path, NAME)
 
 
 if __name__ == "__main__":
     out = ensure_out_dir()
-    out_file = generate(out)
-    print(f"Wrote {out_file}")
+    report(NAME, out, build(NAME, out))
 
@@ -1,45 +1,45 @@
-#!/usr/bin/env python3
-
 """
 Generate an LLM flow diagram (alerts loop, tool usage, providers).
 
 Outputs: diagrams/out/llm_flow.svg
+Run:     python -m diagrams.llm_flow
 """
 
 from pathlib import Path
-from graphviz import Digraph
+
+from ._cache import build, render_cached, report
+from ._common import ensure_out_dir
 
 
-def ensure_out_dir() -> Path:
-    out_dir = Path(__file__).parent / "out"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    return out_dir
+NAME = "llm_flow"
 
+DOT_SOURCE = r"""
+digraph autoir_llm_flow {
+    rankdir=LR
 
-def generate(path: Path) -> Path:
-    dot = Digraph("autoir_llm_flow", filename=str(path / "llm_flow"), format="svg")
-    dot.attr(rankdir="LR")
+    events [label="Recent Events\n(TiDB)" shape=cylinder]
+    heur [label="Heuristics\n(error/timeouts/...)" shape=box]
+    prompt [label="Prompt Builder\n(system + context)" shape=box]
+    llm [label="LLM Client\n(Kimi K2 / OpenAI)" shape=box]
+    incidents [label="Incidents JSON\n(title, severity, confidence, dedupe_key)" shape=box]
+    store [label="Incident Store\n(TiDB)" shape=cylinder]
+    notify [label="Notify\n(Slack/SNS)" shape=box]
 
-    dot.node("events", "Recent Events\n(TiDB)", shape="cylinder")
-    dot.node("heur", "Heuristics\n(error/timeouts/...)", shape="box")
-    dot.node("prompt", "Prompt Builder\n(system + context)", shape="box")
-    dot.node("llm", "LLM Client\n(Kimi K2 / OpenAI)", shape="box")
-    dot.node("incidents", "Incidents JSON\n(title, severity, confidence, dedupe_key)", shape="box")
-    dot.node("store", "Incident Store\n(TiDB)", shape="cylinder")
-    dot.node("notify", "Notify\n(Slack/SNS)", shape="box")
+    events -> heur
+    heur -> prompt
+    prompt -> llm
+    llm -> incidents
+    incidents -> store
+    incidents -> notify
+}
+"""
 
-    dot.edge("events", "heur")
-    dot.edge("heur", "prompt")
-    dot.edge("prompt", "llm")
-    dot.edge("llm", "incidents")
-    dot.edge("incidents", "store")
-    dot.edge("incidents", "notify")
 
-    return Path(dot.render(cleanup=True))
+def generate(path: Path) -> bool:
+    return render_cached(DOT_SOURCE, path, NAME)
 
 
 if __name__ == "__main__":
     out = ensure_out_dir()
-    out_file = generate(out)
-    print(f"Wrote {out_file}")
+    report(NAME, out, build(NAME, out))
 
@@ -1,43 +1,43 @@
-#!/usr/bin/env python3
-
 """
 Generate a pipeline diagram (ingestion -> embeddings -> storage -> analysis -> alerts).
 
 Outputs: diagrams/out/pipeline.svg
+Run:     python -m diagrams.pipeline
 """
 
 from pathlib import Path
-from graphviz import Digraph
+
+from ._cache import build, render_cached, report
+from ._common import ensure_out_dir
 
 
-def ensure_out_dir() -> Path:
-    out_dir = Path(__file__).parent / "out"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    return out_dir
+NAME = "pipeline"
 
+DOT_SOURCE = r"""
+digraph autoir_pipeline {
+    rankdir=LR
 
-def generate(path: Path) -> Path:
-    dot = Digraph("autoir_pipeline", filename=str(path / "pipeline"), format="svg")
-    dot.attr(rankdir="LR")
+    ingest [label="Ingest\n(CloudWatch tail)" shape=box]
+    embed [label="Embeddings\n(SageMaker)" shape=box]
+    store [label="Store\nTiDB VECTOR(384)" shape=cylinder]
+    search [label="Search\n(Log Search TUI)" shape=box]
+    analysis [label="Analysis\n(LLM: Kimi K2/OpenAI)" shape=box]
+    alerts [label="Alerts\n(Slack/SNS)" shape=box]
 
-    dot.node("ingest", "Ingest\n(CloudWatch tail)", shape="box")
-    dot.node("embed", "Embeddings\n(SageMaker)", shape="box")
-    dot.node("store", "Store\nTiDB VECTOR(384)", shape="cylinder")
-    dot.node("search", "Search\n(Log Search TUI)", shape="box")
-    dot.node("analysis", "Analysis\n(LLM: Kimi K2/OpenAI)", shape="box")
-    dot.node("alerts", "Alerts\n(Slack/SNS)", shape="box")
+    ingest -> embed [label="messages"]
+    embed -> store [label="vector(384)"]
+    search -> store [label="query vectors" dir=both]
+    analysis -> store [label="context" dir=both]
+    analysis -> alerts [label="incidents"]
+}
+"""
 
-    dot.edge("ingest", "embed", label="messages")
-    dot.edge("embed", "store", label="vector(384)")
-    dot.edge("search", "store", label="query vectors", dir="both")
-    dot.edge("analysis", "store", label="context", dir="both")
-    dot.edge("analysis", "alerts", label="incidents")
 
-    return Path(dot.render(cleanup=True))
+def generate(path: Path) -> bool:
+    return render_cached(DOT_SOURCE, path, NAME)
 
 
 if __name__ == "__main__":
     out = ensure_out_dir()
-    out_file = generate(out)
-    print(f"Wrote {out_file}")
+    report(NAME, out, build(NAME, out))
 
@@ -0,0 +1,14 @@
+// Used by optimize_svg(): svgo's default preset, minus removeTitle, so node
+// and cluster <title>s (tooltips, and what restyle_svg keys on) survive.
+export default {
+  plugins: [
+    {
+      name: "preset-default",
+      params: {
+        overrides: {
+          removeTitle: false,
+        },
+      },
+    },
+  ],
+};